@@ -44,6 +44,7 @@
         'project',
         'hr_timesheet',
         'web',
+        'bus',
         'sale',
         'purchase',
         'product',
@@ -58,41 +59,26 @@
         'security/security.xml',
         'security/ir.model.access.csv',
         'views/dashboard_actions_menus.xml',
+        'data/ir_cron_data.xml',
     ],
     'demo': [
         # Demo data removed - using new ORM-based dashboard
     ],
     'assets': {
         'web.assets_backend': [
-            # External libraries
-            'https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.js',
+            # External libraries - Chart.js 4 as shipped by the web module
+            'web/static/lib/Chart/Chart.js',
             
             # Templates FIRST - must load before JS components
             'farm_management_dashboard/static/src/xml/dashboard_main.xml',
             'farm_management_dashboard/static/src/xml/components/overview_tab.xml',
             
-            # Individual tab templates for better maintainability
-            'farm_management_dashboard/static/src/xml/tabs/projects_tab.xml',
-            'farm_management_dashboard/static/src/xml/tabs/crops_tab.xml',
-            'farm_management_dashboard/static/src/xml/tabs/financials_tab.xml',
-            'farm_management_dashboard/static/src/xml/tabs/sales_tab.xml',
-            'farm_management_dashboard/static/src/xml/tabs/purchases_tab.xml',
-            'farm_management_dashboard/static/src/xml/tabs/inventory_tab.xml',
-            'farm_management_dashboard/static/src/xml/tabs/reports_tab.xml',
-            
             # Common component templates
             'farm_management_dashboard/static/src/xml/components/smart_button.xml',
             
             # Then JS components
             'farm_management_dashboard/static/src/js/components/sidebar/dashboard_sidebar.js',
             'farm_management_dashboard/static/src/js/components/tabs/overview_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/projects_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/crops_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/financials_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/sales_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/purchases_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/inventory_tab.js',
-            'farm_management_dashboard/static/src/js/components/tabs/reports_tab.js',
             
             # Common components and services
             'farm_management_dashboard/static/src/js/components/common/smart_button.js',
@@ -105,6 +91,25 @@
             'farm_management_dashboard/static/src/css/dashboard_main.css',
             'farm_management_dashboard/static/src/css/report_view.css',
         ],
+        # Tabs other than Overview, loaded on demand by the main dashboard
+        'farm_management_dashboard.assets_dashboard_tabs': [
+            # Individual tab templates for better maintainability
+            'farm_management_dashboard/static/src/xml/tabs/projects_tab.xml',
+            'farm_management_dashboard/static/src/xml/tabs/crops_tab.xml',
+            'farm_management_dashboard/static/src/xml/tabs/financials_tab.xml',
+            'farm_management_dashboard/static/src/xml/tabs/sales_tab.xml',
+            'farm_management_dashboard/static/src/xml/tabs/purchases_tab.xml',
+            'farm_management_dashboard/static/src/xml/tabs/inventory_tab.xml',
+            'farm_management_dashboard/static/src/xml/tabs/reports_tab.xml',
+            
+            'farm_management_dashboard/static/src/js/components/tabs/projects_tab.js',
+            'farm_management_dashboard/static/src/js/components/tabs/crops_tab.js',
+            'farm_management_dashboard/static/src/js/components/tabs/financials_tab.js',
+            'farm_management_dashboard/static/src/js/components/tabs/sales_tab.js',
+            'farm_management_dashboard/static/src/js/components/tabs/purchases_tab.js',
+            'farm_management_dashboard/static/src/js/components/tabs/inventory_tab.js',
+            'farm_management_dashboard/static/src/js/components/tabs/reports_tab.js',
+        ],
     },
     'images': ['static/description/index.html'],
 }                
\ No newline at end of file
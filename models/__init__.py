@@ -3,4 +3,5 @@ from . import dashboard_data
 from . import dashboard_kpi
 from . import dashboard_access
 from . import dashboard_bus_handlers
-from . import dashboard_report_helpers
\ No newline at end of file
+from . import dashboard_report_helpers
+from . import farm_models_extension
\ No newline at end of file
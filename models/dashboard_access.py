@@ -1,14 +1,115 @@
-from odoo import fields, models, api, _
+from odoo import fields, models, api, tools, _lt
+from odoo.tools import frozendict
+from odoo.tools.sql import create_index
+from types import MappingProxyType
+import copy
 import logging
 
 _logger = logging.getLogger(__name__)
 
+# Dashboard role granted by each security group, most privileged role first
+_ROLE_GROUPS = [
+    ('owner', (
+        'base.group_system',
+        'base.group_erp_manager',
+        'farm_management_dashboard.group_farm_owner',
+    )),
+    ('manager', (
+        'farm_management_dashboard.group_farm_manager',
+        'farm_management.group_farm_manager',
+    )),
+    ('accountant', (
+        'farm_management_dashboard.group_farm_accountant',
+        'farm_management.group_farm_accountant',
+    )),
+    ('user', (
+        'farm_management_dashboard.group_farm_dashboard_access',
+        'farm_management.group_farm_user',
+    )),
+]
+
+# Default permission flags applied to access records for each role
+_ROLE_PERMISSIONS = {
+    'owner': MappingProxyType({
+        'can_access_overview': True,
+        'can_access_projects': True,
+        'can_access_crops': True,
+        'can_access_financials': True,
+        'can_access_sales': True,
+        'can_access_purchases': True,
+        'can_access_inventory': True,
+        'can_access_reports': True,
+        'can_export_data': True,
+        'can_modify_filters': True,
+        'can_view_costs': True,
+        'can_view_profits': True,
+    }),
+    'manager': MappingProxyType({
+        'can_access_overview': True,
+        'can_access_projects': True,
+        'can_access_crops': True,
+        'can_access_financials': True,
+        'can_access_sales': True,
+        'can_access_purchases': True,
+        'can_access_inventory': True,
+        'can_access_reports': True,
+        'can_export_data': True,
+        'can_modify_filters': True,
+        'can_view_costs': True,
+        'can_view_profits': False,  # Managers see costs but not detailed profits
+    }),
+    'accountant': MappingProxyType({
+        'can_access_overview': True,
+        'can_access_projects': False,
+        'can_access_crops': False,
+        'can_access_financials': True,
+        'can_access_sales': True,
+        'can_access_purchases': True,
+        'can_access_inventory': True,
+        'can_access_reports': True,
+        'can_export_data': True,
+        'can_modify_filters': False,
+        'can_view_costs': True,
+        'can_view_profits': True,
+    }),
+    'user': MappingProxyType({
+        'can_access_overview': True,
+        'can_access_projects': True,
+        'can_access_crops': True,
+        'can_access_financials': False,  # Basic users don't see financials
+        'can_access_sales': False,
+        'can_access_purchases': False,
+        'can_access_inventory': False,
+        'can_access_reports': True,
+        'can_export_data': False,
+        'can_modify_filters': True,
+        'can_view_costs': False,
+        'can_view_profits': False,
+    }),
+}
+
+# Dashboard tabs in display order: (key, icon, label)
+_TAB_INFO = [
+    ('overview', '🌾', _lt('Overview')),
+    ('projects', '🚜', _lt('Projects')),
+    ('crops', '🌱', _lt('Crops')),
+    ('financials', '💰', _lt('Financials')),
+    ('sales', '📊', _lt('Sales')),
+    ('purchases', '🛒', _lt('Purchases')),
+    ('inventory', '📦', _lt('Inventory')),
+    ('reports', '📈', _lt('Reports')),
+]
+
+# Permission flag fields of farm.dashboard.access (same keys as the role defaults)
+_ACCESS_FLAG_FIELDS = list(_ROLE_PERMISSIONS['owner'])
+
+
 class FarmDashboardAccess(models.Model):
     _name = 'farm.dashboard.access'
     _description = 'Farm Dashboard Access Control'
     
     name = fields.Char('Name', required=True)
-    user_id = fields.Many2one('res.users', 'User', required=True)
+    user_id = fields.Many2one('res.users', 'User', required=True, index=True)
     role = fields.Selection([
         ('owner', 'Farm Owner'),
         ('manager', 'Farm Manager'),
@@ -34,84 +135,111 @@ class FarmDashboardAccess(models.Model):
     active = fields.Boolean('Active', default=True)
     company_id = fields.Many2one('res.company', 'Company', default=lambda self: self.env.company)
     
+    def init(self):
+        """Partial index for the active-record lookup of get_user_permissions"""
+        create_index(
+            self.env.cr,
+            'farm_dashboard_access_user_active_idx',
+            self._table,
+            ['user_id'],
+            where='active',
+        )
+    
     @api.model_create_multi
     def create(self, vals_list):
         """Set default permissions based on role"""
+        get_role_permissions = _ROLE_PERMISSIONS.get
         for vals in vals_list:
-            if 'role' in vals:
-                role_permissions = self._get_role_permissions(vals['role'])
-                vals.update(role_permissions)
-        return super().create(vals_list)
+            if role := vals.get('role'):
+                vals.update(get_role_permissions(role, {}))
+        records = super().create(vals_list)
+        # Cached permissions are derived from these records
+        self.env.registry.clear_cache()
+        records.user_id._notify_dashboard_permissions_changed()
+        return records
     
     def write(self, vals):
         """Update permissions when role changes"""
         if 'role' in vals:
             role_permissions = self._get_role_permissions(vals['role'])
             vals.update(role_permissions)
-        return super().write(vals)
+        users = self.user_id
+        result = super().write(vals)
+        self.env.registry.clear_cache()
+        (users | self.user_id)._notify_dashboard_permissions_changed()
+        return result
+    
+    def unlink(self):
+        """Drop cached permissions of the removed records"""
+        users = self.user_id
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        users._notify_dashboard_permissions_changed()
+        return result
     
-    @api.model
     def _get_role_permissions(self, role):
         """Get default permissions for each role"""
-        permissions = {
-            'owner': {
-                'can_access_overview': True,
-                'can_access_projects': True,
-                'can_access_crops': True,
-                'can_access_financials': True,
-                'can_access_sales': True,
-                'can_access_purchases': True,
-                'can_access_inventory': True,
-                'can_access_reports': True,
-                'can_export_data': True,
-                'can_modify_filters': True,
-                'can_view_costs': True,
-                'can_view_profits': True,
-            },
-            'manager': {
-                'can_access_overview': True,
-                'can_access_projects': True,
-                'can_access_crops': True,
-                'can_access_financials': True,
-                'can_access_sales': True,
-                'can_access_purchases': True,
-                'can_access_inventory': True,
-                'can_access_reports': True,
-                'can_export_data': True,
-                'can_modify_filters': True,
-                'can_view_costs': True,
-                'can_view_profits': False,  # Managers see costs but not detailed profits
-            },
-            'accountant': {
-                'can_access_overview': True,
-                'can_access_projects': False,
-                'can_access_crops': False,
-                'can_access_financials': True,
-                'can_access_sales': True,
-                'can_access_purchases': True,
-                'can_access_inventory': True,
-                'can_access_reports': True,
-                'can_export_data': True,
-                'can_modify_filters': False,
-                'can_view_costs': True,
-                'can_view_profits': True,
-            },
-            'user': {
-                'can_access_overview': True,
-                'can_access_projects': True,
-                'can_access_crops': True,
-                'can_access_financials': False,  # Basic users don't see financials
-                'can_access_sales': False,
-                'can_access_purchases': False,
-                'can_access_inventory': False,
-                'can_access_reports': True,
-                'can_export_data': False,
-                'can_modify_filters': True,
-                'can_view_costs': False,
-                'can_view_profits': False,
-            }
-        }
-        return permissions.get(role, {})
+        return dict(_ROLE_PERMISSIONS.get(role, {}))
+    
+    @tools.ormcache()
+    def _resolve_group_ids(self):
+        """Map the database id of each group of _ROLE_GROUPS to its role
+        
+        Group xmlids only move on module install/update, which clears the
+        registry caches, so the ir.model.data lookups are done once.
+        """
+        ir_model_data = self.env['ir.model.data']
+        role_by_gid = {}
+        for role, xmlids in _ROLE_GROUPS:
+            for xmlid in xmlids:
+                gid = ir_model_data._xmlid_to_res_id(xmlid, raise_if_not_found=False)
+                if gid:
+                    role_by_gid.setdefault(gid, role)
+        return frozendict(role_by_gid)
+    
+    @api.model
+    def _get_user_group_role(self, user_id):
+        """Resolve the dashboard role from the user's groups with a single query
+        
+        Returns the most privileged role of _ROLE_GROUPS the user belongs to,
+        or None when the user has none of the farm dashboard groups.
+        """
+        role_by_gid = self._resolve_group_ids()
+        if not role_by_gid:
+            return None
+        
+        self.env['res.users'].flush_model(['groups_id'])
+        self.env.cr.execute(
+            "SELECT gid FROM res_groups_users_rel WHERE uid = %s AND gid IN %s",
+            (user_id, tuple(role_by_gid)),
+        )
+        user_roles = {role_by_gid[gid] for gid, in self.env.cr.fetchall()}
+        for role, _xmlids in _ROLE_GROUPS:
+            if role in user_roles:
+                return role
+        return None
+    
+    @api.model
+    def _sync_access_role(self, user_id, role):
+        """Align the user's access record with the role from security groups
+        
+        Called when the user's groups change rather than on every permission
+        read, so that get_user_permissions stays free of writes.
+        """
+        if role not in dict(self._fields['role'].selection):
+            return self.browse()
+        access_record = self.sudo().search([('user_id', '=', user_id), ('active', '=', True)], limit=1)
+        if not access_record:
+            user = self.env['res.users'].sudo().browse(user_id)
+            return self.sudo().create({
+                'name': f"Auto-generated for {user.name}",
+                'user_id': user_id,
+                'role': role,
+                # The rest will be set by the create method's role defaults
+            })
+        if access_record.role != role:
+            access_record.write({'role': role})
+        return access_record
     
     @api.model
     def get_user_permissions(self, user_id=None):
@@ -121,38 +249,29 @@ class FarmDashboardAccess(models.Model):
         # Convert to integer ID if a recordset was provided
         if hasattr(user_id, '_name') and user_id._name == 'res.users':
             user_id = user_id.id
-        _logger.info(f"Fetching permissions for user_id: {user_id}")
+        # The cached dict is shared between calls, hand out a private copy
+        return copy.deepcopy(self._get_user_permissions_cached(user_id, self.env.company.id))
+    
+    @tools.ormcache('user_id', 'company_id')
+    def _get_user_permissions_cached(self, user_id, company_id):
+        """Compute permissions once per (user, company)
         
+        Invalidated whenever an access record changes or the user's groups
+        are modified (res.users clears the registry cache on group writes).
+        """
         # Get the user record
         user = self.env['res.users'].sudo().browse(user_id)
-        _logger.info(f"Current model: {self._name}, User: {user.name}")
         
         # First determine the user's role based on security groups - consistent with dashboard_data._get_user_role
-        role = None
-        if user.has_group('base.group_system') or user.has_group('base.group_erp_manager'):
-            # Admin users get owner role
-            role = 'owner'
-            _logger.info(f"User {user_id} is admin, assigned role: {role}")
-        elif user.has_group('farm_management_dashboard.group_farm_owner'):
-            role = 'owner'
-            _logger.info(f"User {user_id} has Farm Owner group")
-        elif user.has_group('farm_management_dashboard.group_farm_manager') or user.has_group('farm_management.group_farm_manager'):
-            role = 'manager'
-            _logger.info(f"User {user_id} has Farm Manager group")
-        elif user.has_group('farm_management_dashboard.group_farm_accountant') or user.has_group('farm_management.group_farm_accountant'):
-            role = 'accountant'
-            _logger.info(f"User {user_id} has Farm Accountant group")
-        elif user.has_group('farm_management_dashboard.group_farm_dashboard_access'):
-            # Basic dashboard access without specific role
-            role = 'user'
-            _logger.info(f"User {user_id} has basic Farm Dashboard Access group")
-        elif user.has_group('farm_management.group_farm_user'):
-            role = 'user'
-            _logger.info(f"User {user_id} has Farm Management User group")
+        role = self._get_user_group_role(user_id)
+        _logger.debug("User %s resolved dashboard role: %s", user_id, role)
+        
+        # Administrators always get the owner defaults, skip the access record lookup
+        if role == 'owner' and user._is_admin():
+            return self._get_role_default_user_permissions(role)
         
         # If no role could be determined from security groups, don't provide access by default
         if not role:
-            _logger.info(f"User {user_id} has no farm dashboard roles - no access granted")
             # Return minimal access - no access to dashboard tabs
             return {
                 'role': 'no_access',
@@ -175,57 +294,43 @@ class FarmDashboardAccess(models.Model):
             }
         
         # Now that we have determined the user's role from security groups,
-        # check if there is a custom access record
-        domain = [('user_id', '=', user_id), ('active', '=', True)]
-        access_record = self.search(domain, limit=1)
-        
-        # If there's an existing record that doesn't match the security group role,
-        # update it to maintain consistency
-        if access_record and access_record.role != role:
-            try:
-                _logger.info(f"Updating access record role from {access_record.role} to {role}")
-                access_record.sudo().write({'role': role})
-            except Exception as e:
-                _logger.error(f"Failed to update access record role: {e}")
-        
-        # If no custom record exists, create one
-        if not access_record:
-            try:
-                _logger.info(f"Creating new access record with role: {role}")
-                access_record = self.sudo().create({
-                    'name': f"Auto-generated for {user.name}",
-                    'user_id': user_id,
-                    'role': role,
-                    # The rest will be set by the create method's role defaults
-                })
-                _logger.info(f"Created new access record: {access_record}")
-            except Exception as e:
-                _logger.error(f"Failed to create access record: {e}")
+        # check if there is a custom access record. The result is shared by
+        # every caller with the same key, so it must not depend on the
+        # caller's record rules: read as superuser, restricted to the company
+        domain = [('user_id', '=', user_id), ('company_id', '=', company_id), ('active', '=', True)]
+        # Only the role and the permission flags are needed, skip the other columns
+        access_data = self.sudo().search_read(domain, ['role'] + _ACCESS_FLAG_FIELDS, limit=1)
+        access_data = access_data[0] if access_data else None
         
-        # If we have an access record, use its permissions
-        if access_record:
-            _logger.info(f"Access record role: {access_record.role}")
+        # A record whose role no longer matches the groups is stale until the
+        # next group change syncs it (see _sync_access_role), so ignore it
+        if access_data and access_data['role'] == role:
             return {
-                'role': access_record.role,
+                'role': access_data['role'],
                 'tabs': {
-                    'overview': access_record.can_access_overview,
-                    'projects': access_record.can_access_projects,
-                    'crops': access_record.can_access_crops,
-                    'financials': access_record.can_access_financials,
-                    'sales': access_record.can_access_sales,
-                    'purchases': access_record.can_access_purchases,
-                    'inventory': access_record.can_access_inventory,
-                    'reports': access_record.can_access_reports,
+                    'overview': access_data['can_access_overview'],
+                    'projects': access_data['can_access_projects'],
+                    'crops': access_data['can_access_crops'],
+                    'financials': access_data['can_access_financials'],
+                    'sales': access_data['can_access_sales'],
+                    'purchases': access_data['can_access_purchases'],
+                    'inventory': access_data['can_access_inventory'],
+                    'reports': access_data['can_access_reports'],
                 },
                 'permissions': {
-                    'export_data': access_record.can_export_data,
-                    'modify_filters': access_record.can_modify_filters,
-                    'view_costs': access_record.can_view_costs,
-                    'view_profits': access_record.can_view_profits,
+                    'export_data': access_data['can_export_data'],
+                    'modify_filters': access_data['can_modify_filters'],
+                    'view_costs': access_data['can_view_costs'],
+                    'view_profits': access_data['can_view_profits'],
                 }
             }
         
-        # Fallback permissions if creation fails - use the role-based defaults
+        # No usable access record - use the role-based defaults
+        return self._get_role_default_user_permissions(role)
+    
+    @api.model
+    def _get_role_default_user_permissions(self, role):
+        """Build the get_user_permissions result from the role defaults"""
         permissions = self._get_role_permissions(role)
         return {
             'role': role,
@@ -253,31 +358,60 @@ class FarmDashboardAccess(models.Model):
         permissions = self.get_user_permissions(user_id)
         return permissions['tabs'].get(tab_name, False)
     
+    @api.model
+    def check_tab_access_batch(self, tab_names, user_id=None):
+        """Check access to several tabs at once
+        
+        Returns:
+            dict: {tab_name: bool} for each requested tab
+        """
+        tabs = self.get_user_permissions(user_id)['tabs']
+        return {tab_name: tabs.get(tab_name, False) for tab_name in tab_names}
+    
     @api.model
     def get_accessible_tabs(self, user_id=None):
         """Get list of tabs accessible to user"""
-        permissions = self.get_user_permissions(user_id)
+        tabs = self.get_user_permissions(user_id)['tabs']
         accessible_tabs = []
-        
-        tab_info = [
-            ('overview', '🌾', _('Overview')),
-            ('projects', '🚜', _('Projects')),
-            ('crops', '🌱', _('Crops')),
-            ('financials', '💰', _('Financials')),
-            ('sales', '📊', _('Sales')),
-            ('purchases', '🛒', _('Purchases')),
-            ('inventory', '📦', _('Inventory')),
-            ('reports', '📈', _('Reports')),
-        ]
-        
-        for tab_key, tab_icon, tab_name in tab_info:
-            if permissions['tabs'].get(tab_key, False):
+        for tab_key, tab_icon, tab_label in _TAB_INFO:
+            if tabs.get(tab_key, False):
+                tab_name = str(tab_label)
                 accessible_tabs.append({
                     'key': tab_key,
                     'label': f"{tab_icon} {tab_name}",
                     'icon': tab_icon,
                     'name': tab_name
                 })
-        
         return accessible_tabs
 
+
+class ResUsers(models.Model):
+    _inherit = 'res.users'
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Create dashboard access records for new farm users"""
+        users = super().create(vals_list)
+        users._sync_farm_dashboard_access()
+        return users
+    
+    def write(self, vals):
+        """Resync dashboard access records when groups change"""
+        result = super().write(vals)
+        if any(key == 'groups_id' or key.startswith(('in_group_', 'sel_groups_')) for key in vals):
+            self._sync_farm_dashboard_access()
+        return result
+    
+    def _notify_dashboard_permissions_changed(self):
+        """Push one bus message per user so open dashboards drop cached permissions"""
+        if not self:
+            return
+        bus = self.env['bus.bus']
+        for user in self:
+            bus._sendone(user.partner_id, 'farm_dashboard/permissions_invalidated', {'user_id': user.id})
+    
+    def _sync_farm_dashboard_access(self):
+        """Reconcile the farm.dashboard.access role of each user with its groups"""
+        access_model = self.env['farm.dashboard.access'].sudo()
+        for user in self:
+            access_model._sync_access_role(user.id, access_model._get_user_group_role(user.id))
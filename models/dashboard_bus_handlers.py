@@ -1,8 +1,20 @@
-from odoo import models, api, fields, _
+from odoo import models, api, fields, tools, _
 import logging
+import time
+from collections import defaultdict
+from functools import reduce
 
 _logger = logging.getLogger(__name__)
 
+# farm.cultivation.project fields whose changes are pushed to the dashboard
+_PROJECT_FINANCIAL_FIELDS = frozenset({'budget', 'actual_cost', 'revenue'})
+_PROJECT_TRACKED_FIELDS = _PROJECT_FINANCIAL_FIELDS | {'state'}
+
+# Seconds during which a "someone is online in this company" answer is reused
+_LISTENER_CACHE_TTL = 30
+# (dbname, company_id) -> (expiry, has_listener), local to the worker
+_listener_cache = {}
+
 
 class DashboardBusHandlers(models.AbstractModel):
     """Handlers for real-time dashboard updates via Odoo bus"""
@@ -17,20 +29,150 @@ class DashboardBusHandlers(models.AbstractModel):
     
     def _send_dashboard_notification(self, message_type, data, company_id=None):
         """Send notification to dashboard clients"""
+        self._send_dashboard_notifications_bulk([(message_type, data, company_id)])
+    
+    def _send_dashboard_notifications_bulk(self, notifications, invalidate_company_ids=(), timestamp=None):
+        """Queue several dashboard notifications for the current transaction
+        
+        Nothing is sent right away: the notifications are collected in the
+        cursor's precommit data and _flush_dashboard_notifications hands them
+        over to the bus right before commit. A rolled back
+        transaction therefore sends nothing.
+        
+        Args:
+            notifications (list): (message_type, data, company_id) tuples
+            invalidate_company_ids (iterable): companies whose dashboards must
+                be invalidated, one invalidate_cache is sent per company and
+                per transaction
+            timestamp (str): ISO timestamp shared by all the notifications,
+                defaults to now
+        """
+        disabled_types = self._get_disabled_notification_types()
+        pending = self._get_pending_dashboard_notifications()
+        # Timestamp the events when they happen, not when they are flushed
+        if notifications and not timestamp:
+            timestamp = fields.Datetime.now().isoformat()
+        for message_type, data, company_id in notifications:
+            if message_type in disabled_types:
+                continue
+            pending['messages'].append((
+                message_type,
+                data,
+                company_id or self.env.company.id,
+                timestamp,
+            ))
+        if 'invalidate_cache' not in disabled_types:
+            pending['invalidate_company_ids'].update(
+                company_id or self.env.company.id for company_id in invalidate_company_ids
+            )
+    
+    @api.model
+    @tools.ormcache()
+    def _get_disabled_notification_types(self):
+        """Get the notification types disabled for this database
+        
+        Read from the comma separated farm_dashboard.disabled_notification_types
+        system parameter, e.g. "analytic_lines_created_batch,task_stage_changed".
+        Writing a system parameter clears the registry cache, so changes are
+        picked up right away.
+        """
+        param = self.env['ir.config_parameter'].sudo().get_param(
+            'farm_dashboard.disabled_notification_types', ''
+        )
+        return frozenset(filter(None, (name.strip() for name in param.split(','))))
+    
+    def _get_pending_dashboard_notifications(self):
+        """Get the notifications queued in the current transaction"""
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get('farm_dashboard.notifications')
+        if pending is None:
+            pending = precommit.data['farm_dashboard.notifications'] = {
+                'messages': [],
+                'invalidate_company_ids': set(),
+            }
+            precommit.add(self._flush_dashboard_notifications)
+        return pending
+    
+    def _flush_dashboard_notifications(self):
+        """Precommit hook handing the queued notifications over to the bus
+        
+        bus.bus._sendone only appends to the bus' own precommit queue: all the
+        rows are created with a single multi-row INSERT and one NOTIFY is sent
+        after commit, so no raw SQL is needed to batch them.
+        """
+        pending = self.env.cr.precommit.data.pop('farm_dashboard.notifications', None)
+        if not pending:
+            return
+        timestamp = fields.Datetime.now().isoformat()
+        messages = pending['messages'] + [
+            ('invalidate_cache', {}, company_id, timestamp)
+            for company_id in pending['invalidate_company_ids']
+        ]
+        # Nobody can receive them, skip the bus rows (crons, imports...)
+        listeners = {
+            company_id: self._has_dashboard_listener(company_id)
+            for company_id in {message[2] for message in messages}
+        }
+        messages = self._throttle_dashboard_notifications(
+            [message for message in messages if listeners[message[2]]]
+        )
+        if not messages:
+            return
         try:
-            channel = self._get_dashboard_channel(company_id)
-            self.env['bus.bus']._sendone(channel, {
-                'type': message_type,
-                'data': data,
-                'timestamp': fields.Datetime.now().isoformat()
-            })
-            _logger.debug(f"Sent dashboard notification: {message_type} to channel {channel}")
+            bus = self.env['bus.bus']
+            channels = {}
+            for message_type, data, company_id, message_timestamp in messages:
+                # Resolve each company's channel once per flush
+                channel = channels.get(company_id)
+                if channel is None:
+                    channel = channels[company_id] = self._get_dashboard_channel(company_id)
+                bus._sendone(channel, message_type, {
+                    'type': message_type,
+                    'data': data,
+                    'timestamp': message_timestamp
+                })
+                _logger.debug("Sent dashboard notification: %s to channel %s", message_type, channel)
         except Exception as e:
-            _logger.error(f"Failed to send dashboard notification: {str(e)}")
+            _logger.error("Failed to send dashboard notification: %s", e)
+    
+    def _throttle_dashboard_notifications(self, messages):
+        """Collapse the rapid-fire notifications of a transaction
+        
+        Only the last notification per type and record (the first *_id of the
+        payload) is kept, notifications without a record id are never merged.
+        Nothing is dropped across transactions: the last transaction of a
+        burst must reach the clients, or they would keep stale data.
+        """
+        latest = {}
+        for index, (message_type, data, company_id, _timestamp) in enumerate(messages):
+            record_id = next((value for key, value in data.items() if key.endswith('_id')), None)
+            latest[(message_type, company_id, record_id) if record_id else index] = index
+        return [messages[index] for index in sorted(latest.values())]
+    
+    def _has_dashboard_listener(self, company_id):
+        """Check whether a user of the company is connected to the bus
+        
+        Connected users are taken from the bus presences. The answer is kept
+        for _LISTENER_CACHE_TTL seconds so that batches of transactions do not
+        query the presences each time, a user connecting in between gets the
+        fresh data when the dashboard loads anyway.
+        """
+        key = (self.env.cr.dbname, company_id)
+        now = time.monotonic()
+        cached = _listener_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+        presence_model = 'mail.presence' if 'mail.presence' in self.env else 'bus.presence'
+        has_listener = bool(self.env[presence_model].sudo().search_count([
+            ('status', 'in', ('online', 'away')),
+            ('user_id.company_ids', 'in', company_id),
+        ], limit=1))
+        _listener_cache[key] = (now + _LISTENER_CACHE_TTL, has_listener)
+        return has_listener
     
     def _invalidate_dashboard_cache(self, company_id=None):
         """Send cache invalidation notification"""
-        self._send_dashboard_notification('invalidate_cache', {}, company_id)
+        self._send_dashboard_notifications_bulk([], [company_id])
     
     def _update_kpi_data(self, kpi_name, value, company_id=None):
         """Send KPI update notification"""
@@ -40,6 +182,71 @@ class DashboardBusHandlers(models.AbstractModel):
         }, company_id)
 
 
+class DashboardBusMixin(models.AbstractModel):
+    """Send a dashboard notification when tracked fields are written
+    
+    Inheriting models configure the notification with class attributes:
+    
+    * _dashboard_bus_tracked_fields: fields whose write sends the notification
+    * _dashboard_bus_notification_type: type of the notification
+    * _dashboard_bus_payload: payload key -> field path, dotted for related
+      fields (e.g. 'project_id.name')
+    * _dashboard_bus_domain: optional domain restricting the notified records
+    """
+    _name = 'farm.dashboard.bus.mixin'
+    _description = 'Farm Dashboard Bus Mixin'
+    
+    _dashboard_bus_tracked_fields = frozenset()
+    _dashboard_bus_notification_type = None
+    _dashboard_bus_payload = {}
+    _dashboard_bus_domain = None
+    
+    def write(self, vals):
+        """Send the configured notification when a tracked field is written"""
+        if not self._dashboard_bus_tracked_fields & vals.keys():
+            return super().write(vals)
+        
+        result = super().write(vals)
+        
+        records = self
+        if self._dashboard_bus_domain:
+            records = self.with_context(active_test=False).search(
+                [('id', 'in', self.ids)] + self._dashboard_bus_domain
+            )
+        records._prefetch_dashboard_bus_payload()
+        notifications = [
+            (
+                self._dashboard_bus_notification_type,
+                record._get_dashboard_bus_payload(),
+                record.company_id.id
+            )
+            for record in records
+        ]
+        
+        # Invalidate dashboard cache once per company
+        self.env['farm.dashboard.bus.handlers']._send_dashboard_notifications_bulk(
+            notifications, records.company_id.ids
+        )
+        
+        return result
+    
+    def _prefetch_dashboard_bus_payload(self):
+        """Load the payload fields of all the records with batched queries"""
+        paths = [path.split('.') for path in self._dashboard_bus_payload.values()]
+        self.fetch(list({path[0] for path in paths if path[0] != 'id'} | {'company_id'}))
+        for path in paths:
+            if len(path) == 2 and path[1] != 'id':
+                self[path[0]].fetch([path[1]])
+    
+    def _get_dashboard_bus_payload(self):
+        """Build the notification payload of a single record"""
+        self.ensure_one()
+        return {
+            key: reduce(getattr, path.split('.'), self)
+            for key, path in self._dashboard_bus_payload.items()
+        }
+
+
 class CultivationProjectBusHandler(models.Model):
     """Bus handler for cultivation project changes"""
     _inherit = 'farm.cultivation.project'
@@ -49,9 +256,10 @@ class CultivationProjectBusHandler(models.Model):
         """Send notification when cultivation projects are created"""
         result = super().create(vals_list)
         
+        notifications = []
         for record in result:
             # Send project creation notification
-            self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
+            notifications.append((
                 'project_created',
                 {
                     'project_id': record.id,
@@ -61,61 +269,70 @@ class CultivationProjectBusHandler(models.Model):
                     'budget': record.budget,
                 },
                 record.company_id.id
-            )
-            
-            # Invalidate dashboard cache
-            self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
+            ))
+        
+        # Invalidate dashboard cache once per company
+        self.env['farm.dashboard.bus.handlers']._send_dashboard_notifications_bulk(
+            notifications, result.company_id.ids
+        )
         
         return result
     
     def write(self, vals):
         """Send notification when cultivation projects are updated"""
-        # Store old values for comparison
-        old_values = {}
-        for record in self:
-            old_values[record.id] = {
-                'state': record.state,
-                'budget': record.budget,
-                'actual_cost': record.actual_cost,
-                'revenue': record.revenue,
-            }
+        # Writes to untracked fields (chatter, followers...) are not dashboard events
+        if not _PROJECT_TRACKED_FIELDS & vals.keys():
+            return super().write(vals)
+        
+        # Store old states for comparison, the financial notification only
+        # carries the new values
+        state_written = 'state' in vals
+        old_states = {
+            values['id']: values['state']
+            for values in self.read(['state'])
+        } if state_written else {}
         
         result = super().write(vals)
         
-        # Send notifications for significant changes
-        for record in self:
-            old_vals = old_values.get(record.id, {})
-            
-            # Check for state changes
-            if 'state' in vals and old_vals.get('state') != record.state:
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'project_state_changed',
-                    {
-                        'project_id': record.id,
-                        'project_name': record.name,
-                        'old_state': old_vals.get('state'),
-                        'new_state': record.state,
-                    },
-                    record.company_id.id
-                )
-            
-            # Check for budget/cost changes
-            if any(field in vals for field in ['budget', 'actual_cost', 'revenue']):
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'project_financial_updated',
-                    {
-                        'project_id': record.id,
-                        'project_name': record.name,
-                        'budget': record.budget,
-                        'actual_cost': record.actual_cost,
-                        'revenue': record.revenue,
-                        'profit': record.profit,
-                    },
-                    record.company_id.id
-                )
-            
-            # Invalidate dashboard cache
-            self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
+        # Split the projects per notification and only loop on each subset
+        state_changed = self.filtered(
+            lambda r: old_states.get(r.id) != r.state
+        ) if state_written else self.browse()
+        financial_changed = self if _PROJECT_FINANCIAL_FIELDS & vals.keys() else self.browse()
+        
+        notifications = [
+            (
+                'project_state_changed',
+                {
+                    'project_id': record.id,
+                    'project_name': record.name,
+                    'old_state': old_states.get(record.id),
+                    'new_state': record.state,
+                },
+                record.company_id.id
+            )
+            for record in state_changed
+        ]
+        notifications += [
+            (
+                'project_financial_updated',
+                {
+                    'project_id': record.id,
+                    'project_name': record.name,
+                    'budget': record.budget,
+                    'actual_cost': record.actual_cost,
+                    'revenue': record.revenue,
+                    'profit': record.profit,
+                },
+                record.company_id.id
+            )
+            for record in financial_changed
+        ]
+        
+        # Invalidate dashboard cache once per company
+        self.env['farm.dashboard.bus.handlers']._send_dashboard_notifications_bulk(
+            notifications, self.company_id.ids
+        )
         
         return result
     
@@ -133,45 +350,29 @@ class CultivationProjectBusHandler(models.Model):
         result = super().unlink()
         
         # Send deletion notifications
-        for info in project_info:
-            self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                'project_deleted',
-                info,
-                info['company_id']
-            )
-            self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(info['company_id'])
+        self.env['farm.dashboard.bus.handlers']._send_dashboard_notifications_bulk(
+            [('project_deleted', info, info['company_id']) for info in project_info],
+            [info['company_id'] for info in project_info]
+        )
         
         return result
 
 
 class DailyReportBusHandler(models.Model):
     """Bus handler for daily report changes"""
-    _inherit = 'farm.daily.report'
+    _name = 'farm.daily.report'
+    _inherit = ['farm.daily.report', 'farm.dashboard.bus.mixin']
     
-    def write(self, vals):
-        """Send notification when daily reports are updated"""
-        result = super().write(vals)
-        
-        # Send notification for state changes
-        if 'state' in vals:
-            for record in self:
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'daily_report_state_changed',
-                    {
-                        'report_id': record.id,
-                        'report_name': record.name,
-                        'project_id': record.project_id.id,
-                        'project_name': record.project_id.name,
-                        'new_state': record.state,
-                        'operation_type': record.operation_type,
-                    },
-                    record.company_id.id
-                )
-                
-                # Invalidate dashboard cache
-                self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
-        
-        return result
+    _dashboard_bus_tracked_fields = frozenset({'state'})
+    _dashboard_bus_notification_type = 'daily_report_state_changed'
+    _dashboard_bus_payload = {
+        'report_id': 'id',
+        'report_name': 'name',
+        'project_id': 'project_id.id',
+        'project_name': 'project_id.name',
+        'new_state': 'state',
+        'operation_type': 'operation_type',
+    }
 
 
 class StockMoveBusHandler(models.Model):
@@ -180,29 +381,38 @@ class StockMoveBusHandler(models.Model):
     
     def write(self, vals):
         """Send notification when stock moves are validated"""
+        if vals.get('state') != 'done':
+            return super().write(vals)
+        
         result = super().write(vals)
         
         # Send notification for state changes to 'done'
-        if 'state' in vals and vals['state'] == 'done':
-            for record in self:
-                # Only send for farm-related moves
-                if record.daily_report_id or (record.picking_id and 'farm' in record.picking_id.origin.lower()):
-                    self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                        'stock_move_validated',
-                        {
-                            'move_id': record.id,
-                            'product_id': record.product_id.id,
-                            'product_name': record.product_id.name,
-                            'quantity': record.product_uom_qty,
-                            'location_from': record.location_id.name,
-                            'location_to': record.location_dest_id.name,
-                        },
-                        record.company_id.id
-                    )
-                    
-                    # Invalidate dashboard cache
-                    self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
+        # Only send for farm-related moves
+        farm_moves = self.search([
+            ('id', 'in', self.ids),
+            '|', ('daily_report_id', '!=', False), ('picking_id.is_farm_related', '=', True),
+        ])
+        # One aggregate notification per company instead of one per move
+        moves_by_company = defaultdict(list)
+        for record in farm_moves:
+            moves_by_company[record.company_id.id].append({
+                'move_id': record.id,
+                'product_id': record.product_id.id,
+                'product_name': record.product_id.name,
+                'quantity': record.product_uom_qty,
+                'location_from': record.location_id.name,
+                'location_to': record.location_dest_id.name,
+            })
+        notifications = [
+            ('stock_moves_validated_batch', {'moves': moves}, company_id)
+            for company_id, moves in moves_by_company.items()
+        ]
         
+        # Invalidate dashboard cache once per company
+        self.env['farm.dashboard.bus.handlers']._send_dashboard_notifications_bulk(
+            notifications, list(moves_by_company)
+        )
+
         return result
 
 
@@ -215,140 +425,99 @@ class AnalyticLineBusHandler(models.Model):
         """Send notification when analytic lines are created"""
         result = super().create(vals_list)
         
-        for record in result:
-            # Only send for farm-related analytic lines
-            if record.daily_report_id or (record.account_id and 'farm' in record.account_id.name.lower()):
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'analytic_line_created',
-                    {
-                        'line_id': record.id,
-                        'account_id': record.account_id.id,
-                        'account_name': record.account_id.name,
-                        'amount': record.amount,
-                        'date': record.date.isoformat() if record.date else None,
-                    },
-                    record.company_id.id
-                )
-                
-                # Invalidate dashboard cache
-                self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
+        # Only send for farm-related analytic lines
+        farm_lines = self.search([
+            ('id', 'in', result.ids),
+            '|', ('daily_report_id', '!=', False), ('account_id.is_farm_related', '=', True),
+        ])
+        # One aggregate notification per company instead of one per line
+        lines_by_company = defaultdict(list)
+        for record in farm_lines:
+            lines_by_company[record.company_id.id].append({
+                'line_id': record.id,
+                'account_id': record.account_id.id,
+                'account_name': record.account_id.name,
+                'amount': record.amount,
+                'date': record.date.isoformat() if record.date else None,
+            })
+        notifications = [
+            ('analytic_lines_created_batch', {'lines': lines}, company_id)
+            for company_id, lines in lines_by_company.items()
+        ]
+        
+        # Invalidate dashboard cache once per company
+        self.env['farm.dashboard.bus.handlers']._send_dashboard_notifications_bulk(
+            notifications, list(lines_by_company)
+        )
         
         return result
 
 
 class PurchaseOrderBusHandler(models.Model):
     """Bus handler for purchase order changes"""
-    _inherit = 'purchase.order'
+    _name = 'purchase.order'
+    _inherit = ['purchase.order', 'farm.dashboard.bus.mixin']
     
-    def write(self, vals):
-        """Send notification when purchase orders are updated"""
-        result = super().write(vals)
-        
-        # Send notification for state changes
-        if 'state' in vals:
-            for record in self:
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'purchase_order_state_changed',
-                    {
-                        'order_id': record.id,
-                        'order_name': record.name,
-                        'partner_name': record.partner_id.name,
-                        'new_state': record.state,
-                        'amount_total': record.amount_total,
-                    },
-                    record.company_id.id
-                )
-                
-                # Invalidate dashboard cache
-                self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
-        
-        return result
+    _dashboard_bus_tracked_fields = frozenset({'state'})
+    _dashboard_bus_notification_type = 'purchase_order_state_changed'
+    _dashboard_bus_payload = {
+        'order_id': 'id',
+        'order_name': 'name',
+        'partner_name': 'partner_id.name',
+        'new_state': 'state',
+        'amount_total': 'amount_total',
+    }
 
 
 class SaleOrderBusHandler(models.Model):
     """Bus handler for sale order changes"""
-    _inherit = 'sale.order'
+    _name = 'sale.order'
+    _inherit = ['sale.order', 'farm.dashboard.bus.mixin']
     
-    def write(self, vals):
-        """Send notification when sale orders are updated"""
-        result = super().write(vals)
-        
-        # Send notification for state changes
-        if 'state' in vals:
-            for record in self:
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'sale_order_state_changed',
-                    {
-                        'order_id': record.id,
-                        'order_name': record.name,
-                        'partner_name': record.partner_id.name,
-                        'new_state': record.state,
-                        'amount_total': record.amount_total,
-                    },
-                    record.company_id.id
-                )
-                
-                # Invalidate dashboard cache
-                self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
-        
-        return result
+    _dashboard_bus_tracked_fields = frozenset({'state'})
+    _dashboard_bus_notification_type = 'sale_order_state_changed'
+    _dashboard_bus_payload = {
+        'order_id': 'id',
+        'order_name': 'name',
+        'partner_name': 'partner_id.name',
+        'new_state': 'state',
+        'amount_total': 'amount_total',
+    }
 
 
 class ProjectTaskBusHandler(models.Model):
     """Bus handler for project task changes"""
-    _inherit = 'project.task'
+    _name = 'project.task'
+    _inherit = ['project.task', 'farm.dashboard.bus.mixin']
     
-    def write(self, vals):
-        """Send notification when project tasks are updated"""
-        result = super().write(vals)
-        
-        # Send notification for stage changes
-        if 'stage_id' in vals:
-            for record in self:
-                # Only send for farm-related projects
-                if record.project_id and 'farm' in record.project_id.name.lower():
-                    self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                        'task_stage_changed',
-                        {
-                            'task_id': record.id,
-                            'task_name': record.name,
-                            'project_id': record.project_id.id,
-                            'project_name': record.project_id.name,
-                            'new_stage': record.stage_id.name,
-                        },
-                        record.company_id.id
-                    )
-                    
-                    # Invalidate dashboard cache
-                    self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
-        
-        return result
+    _dashboard_bus_tracked_fields = frozenset({'stage_id'})
+    _dashboard_bus_notification_type = 'task_stage_changed'
+    _dashboard_bus_payload = {
+        'task_id': 'id',
+        'task_name': 'name',
+        'project_id': 'project_id.id',
+        'project_name': 'project_id.name',
+        'new_stage': 'stage_id.name',
+    }
+    # Only send for tasks of farm-related projects
+    _dashboard_bus_domain = [('project_id.is_farm_related', '=', True)]
 
 
 class MaintenanceRequestBusHandler(models.Model):
     """Bus handler for maintenance request changes"""
-    _inherit = 'maintenance.request'
+    _name = 'maintenance.request'
+    _inherit = ['maintenance.request', 'farm.dashboard.bus.mixin']
     
-    def write(self, vals):
-        """Send notification when maintenance requests are updated"""
-        result = super().write(vals)
-        
-        # Send notification for stage changes
-        if 'stage_id' in vals:
-            for record in self:
-                self.env['farm.dashboard.bus.handlers']._send_dashboard_notification(
-                    'maintenance_request_stage_changed',
-                    {
-                        'request_id': record.id,
-                        'request_name': record.name,
-                        'equipment_name': record.equipment_id.name if record.equipment_id else 'N/A',
-                        'new_stage': record.stage_id.name,
-                    },
-                    record.company_id.id
-                )
-                
-                # Invalidate dashboard cache
-                self.env['farm.dashboard.bus.handlers']._invalidate_dashboard_cache(record.company_id.id)
-        
-        return result
-
+    _dashboard_bus_tracked_fields = frozenset({'stage_id'})
+    _dashboard_bus_notification_type = 'maintenance_request_stage_changed'
+    _dashboard_bus_payload = {
+        'request_id': 'id',
+        'request_name': 'name',
+        'equipment_name': 'equipment_id.name',
+        'new_stage': 'stage_id.name',
+    }
+    
+    def _get_dashboard_bus_payload(self):
+        payload = super()._get_dashboard_bus_payload()
+        payload['equipment_name'] = payload['equipment_name'] or 'N/A'
+        return payload
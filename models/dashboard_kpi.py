@@ -59,15 +59,34 @@ class FarmDashboardKPI(models.AbstractModel):
         filters = filters or {}
         domain = self._build_domain(filters)
         
-        projects = self.env['farm.cultivation.project'].search(domain)
+        Project = self.env['farm.cultivation.project']
+        
+        # Count the projects per state in SQL instead of filtering records
+        active_states = self.env['farm.dashboard.data']._get_active_project_states()
+        state_counts = {
+            data['state']: data['state_count']
+            for data in Project.read_group(domain, ['state'], ['state'])
+        }
+        total_projects = sum(state_counts.values())
+        completed_projects = state_counts.get('done', 0)
+        
+        overdue_projects = Project.search_count(domain + [
+            ('planned_end_date', '<', fields.Date.today()),
+            ('state', 'not in', ['done', 'cancel']),
+        ])
+        completed = Project.search(domain + [
+            ('state', '=', 'done'),
+            ('actual_end_date', '!=', False),
+            ('start_date', '!=', False),
+        ])
         
         return {
-            'total_projects': len(projects),
-            'active_projects': len(projects.filtered(lambda p: self.env['farm.dashboard.data']._is_project_active(p.state))),
-            'completed_projects': len(projects.filtered(lambda p: p.state == 'done')),
-            'overdue_projects': len(projects.filtered(lambda p: p.planned_end_date and p.planned_end_date < fields.Date.today() and p.state not in ['done', 'cancel'])),
-            'avg_project_duration': self._calculate_avg_duration(projects),
-            'completion_rate': self._calculate_completion_rate(projects),
+            'total_projects': total_projects,
+            'active_projects': sum(count for state, count in state_counts.items() if state in active_states),
+            'completed_projects': completed_projects,
+            'overdue_projects': overdue_projects,
+            'avg_project_duration': self._calculate_avg_duration(completed),
+            'completion_rate': completed_projects / total_projects * 100 if total_projects else 0,
         }
     
     @api.model
@@ -175,15 +194,6 @@ class FarmDashboardKPI(models.AbstractModel):
         total_days = sum((p.actual_end_date - p.start_date).days for p in completed_projects)
         return total_days / len(completed_projects)
     
-    @api.model
-    def _calculate_completion_rate(self, projects):
-        """Calculate project completion rate"""
-        if not projects:
-            return 0
-        
-        completed = len(projects.filtered(lambda p: p.state == 'done'))
-        return completed / len(projects) * 100
-    
     @api.model
     def _calculate_stock_turnover(self):
         """Calculate stock turnover rate"""
@@ -40,6 +40,11 @@ class FarmDashboardData(models.Model):
             
             _logger.info(f"Found {len(reports)} daily reports for project {project_id}")
             
+            # Operation type labels, built once for all the reports
+            operation_types = {}
+            if hasattr(reports._fields.get('operation_type', None), 'selection'):
+                operation_types = dict(reports._fields['operation_type']._description_selection(self.env))
+            
             # Prepare comprehensive report data with all necessary fields
             report_data = []
             for report in reports:
@@ -67,10 +72,7 @@ class FarmDashboardData(models.Model):
                     user_name = report.user_id.name
                 
                 # Get operation type label from selection field
-                operation_type_label = report.operation_type
-                if hasattr(report._fields.get('operation_type', None), 'selection'):
-                    selection_dict = dict(report._fields['operation_type'].selection)
-                    operation_type_label = selection_dict.get(report.operation_type, report.operation_type)
+                operation_type_label = operation_types.get(report.operation_type, report.operation_type)
                 
                 # Get cost information
                 cost = 0
@@ -0,0 +1,171 @@
+from odoo import fields, models, api, _
+from odoo.tools.sql import create_index
+
+
+class ProjectProject(models.Model):
+    """Flag farm-related projects for the dashboard bus handlers"""
+    _inherit = 'project.project'
+
+    is_farm_related = fields.Boolean(
+        string=_('Farm Related'),
+        compute='_compute_is_farm_related',
+        store=True,
+        index=True
+    )
+
+    @api.depends('name')
+    def _compute_is_farm_related(self):
+        for record in self:
+            record.is_farm_related = 'farm' in (record.name or '').lower()
+
+
+class AccountAnalyticAccount(models.Model):
+    """Flag farm-related analytic accounts for the dashboard bus handlers"""
+    _inherit = 'account.analytic.account'
+
+    is_farm_related = fields.Boolean(
+        string=_('Farm Related'),
+        compute='_compute_is_farm_related',
+        store=True,
+        index=True
+    )
+
+    @api.depends('name')
+    def _compute_is_farm_related(self):
+        for record in self:
+            record.is_farm_related = 'farm' in (record.name or '').lower()
+
+
+class StockPicking(models.Model):
+    """Flag farm-related pickings for the dashboard bus handlers"""
+    _inherit = 'stock.picking'
+
+    is_farm_related = fields.Boolean(
+        string=_('Farm Related'),
+        compute='_compute_is_farm_related',
+        store=True,
+        index=True
+    )
+
+    @api.depends('origin')
+    def _compute_is_farm_related(self):
+        for record in self:
+            record.is_farm_related = 'farm' in (record.origin or '').lower()
+
+
+class AccountMove(models.Model):
+    """Invalidate the cached financials tab when journal entries change"""
+    _inherit = 'account.move'
+
+    def init(self):
+        """Index for the posted invoices and bills of a period on the financials tab"""
+        super().init()
+        create_index(
+            self.env.cr,
+            'account_move_move_type_state_invoice_date_idx',
+            self._table,
+            ['move_type', 'state', 'invoice_date'],
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['farm.dashboard.data']._invalidate_tab_data_cache(records.company_id.ids)
+        return records
+
+    def write(self, vals):
+        self.env['farm.dashboard.data']._invalidate_tab_data_cache(self.company_id.ids)
+        return super().write(vals)
+
+    def unlink(self):
+        self.env['farm.dashboard.data']._invalidate_tab_data_cache(self.company_id.ids)
+        return super().unlink()
+
+
+class AccountMoveLine(models.Model):
+    """Index the analytically distributed journal items for the financials tab"""
+    _inherit = 'account.move.line'
+
+    def init(self):
+        """Partial index for the posted items with an analytic distribution"""
+        super().init()
+        create_index(
+            self.env.cr,
+            'account_move_line_parent_state_date_analytic_idx',
+            self._table,
+            ['parent_state', 'date', 'move_id'],
+            where='analytic_distribution IS NOT NULL',
+        )
+
+
+class AccountPayment(models.Model):
+    """Invalidate the cached financials tab when payments change"""
+    _inherit = 'account.payment'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['farm.dashboard.data']._invalidate_tab_data_cache(records.company_id.ids)
+        return records
+
+    def write(self, vals):
+        self.env['farm.dashboard.data']._invalidate_tab_data_cache(self.company_id.ids)
+        return super().write(vals)
+
+    def unlink(self):
+        self.env['farm.dashboard.data']._invalidate_tab_data_cache(self.company_id.ids)
+        return super().unlink()
+
+
+class FarmCultivationProject(models.Model):
+    """Keep the farm, field and crop names on the project row for the dashboard"""
+    _inherit = 'farm.cultivation.project'
+
+    farm_name = fields.Char(
+        string=_('Farm Name'),
+        related='farm_id.name',
+        store=True
+    )
+    field_name = fields.Char(
+        string=_('Field Name'),
+        related='field_id.name',
+        store=True
+    )
+    crop_name = fields.Char(
+        string=_('Crop Name'),
+        related='crop_id.name',
+        store=True
+    )
+    progress_percentage = fields.Integer(
+        string=_('Progress (%)'),
+        compute='_compute_progress_percentage',
+        store=True
+    )
+
+    @api.depends('state', 'start_date', 'planned_end_date')
+    def _compute_progress_percentage(self):
+        dashboard_data = self.env['farm.dashboard.data']
+        for record in self:
+            record.progress_percentage = dashboard_data._calculate_project_progress(record)
+
+    @api.model
+    def _cron_refresh_progress_percentage(self):
+        """Recompute the progress of growing projects, it moves with the date"""
+        projects = self.search([('state', '=', 'growing')])
+        self.env.add_to_compute(self._fields['progress_percentage'], projects)
+        projects.flush_recordset(['progress_percentage'])
+
+
+class FarmDailyReport(models.Model):
+    """Index the daily reports for the dashboard recent activities"""
+    _inherit = 'farm.daily.report'
+
+    def init(self):
+        """Index for the latest reports of the projects shown on the overview"""
+        super().init()
+        create_index(
+            self.env.cr,
+            'farm_daily_report_date_project_idx',
+            self._table,
+            ['date DESC', 'project_id'],
+        )
@@ -4,6 +4,7 @@ import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
 import { _t } from "@web/core/l10n/translation";
 import { SmartButton } from "../common/smart_button";
+import { registry } from "@web/core/registry";
 
 export class CropsTab extends Component {
     static template = "farm_management_dashboard.CropsTabTemplate";
@@ -459,3 +460,6 @@ export class CropsTab extends Component {
         }
     }
 }
+
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("crops", CropsTab);
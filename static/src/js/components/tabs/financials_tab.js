@@ -4,6 +4,7 @@ import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
 import { _t } from "@web/core/l10n/translation";
 import { SmartButton } from "../common/smart_button";
+import { registry } from "@web/core/registry";
 
 export class FinancialsTab extends Component {
     static template = "farm_management_dashboard.FinancialsTabTemplate";
@@ -772,3 +773,6 @@ export class FinancialsTab extends Component {
         return new Date(dateTimeString).toLocaleString();
     }
 }
+
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("financials", FinancialsTab);
@@ -4,6 +4,7 @@ import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
 import { _t } from "@web/core/l10n/translation";
 import { SmartButton } from "../common/smart_button";
+import { registry } from "@web/core/registry";
 
 export class InventoryTab extends Component {
     static template = "farm_management_dashboard.InventoryTabTemplate";
@@ -3039,4 +3040,7 @@ InventoryTab.props = {
     userPermissions: { type: Object, optional: true },
     rpcCall: { type: Function, optional: true },
     onFilterChange: { type: Function },
-};
\ No newline at end of file
+};
+
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("inventory", InventoryTab);
@@ -1,8 +1,9 @@
 /** @odoo-module **/
 
-import { Component, useState, useService } from "@odoo/owl";
+import { Component, useState, useService, onWillUnmount } from "@odoo/owl";
 import { _t } from "@web/core/l10n/translation";
 import { SmartButton } from "../common/smart_button";
+import { registry } from "@web/core/registry";
 
 // Global filter lock to prevent multiple instances from filtering simultaneously
 let globalFilterLock = false;
@@ -94,6 +95,10 @@ export class ProjectsTab extends Component {
             validationErrors: {}
         });
         
+        // Chart.js instances of the project detail view, released on unmount
+        this.charts = {};
+        onWillUnmount(() => this.destroyCharts());
+        
         // Bind debounced method
         this.debouncedFilterChange = this.debouncedFilterChange.bind(this);
         
@@ -909,10 +914,20 @@ export class ProjectsTab extends Component {
         };
     }
     
+    destroyCharts() {
+        Object.values(this.charts).forEach(chart => {
+            if (chart) chart.destroy();
+        });
+        this.charts = {};
+    }
+    
     // Render charts using Chart.js or similar
     _renderProjectCharts(project) {
         if (!this.state.projectFinancials) return;
         
+        // Release the previous instances before drawing on the canvases again
+        this.destroyCharts();
+        
         try {
             const financials = this.state.projectFinancials;
             
@@ -925,7 +940,7 @@ export class ProjectsTab extends Component {
             // Budget vs. Actual Costs Chart
             const budgetCtx = document.getElementById('project-budget-chart');
             if (budgetCtx) {
-                new Chart(budgetCtx, {
+                this.charts.budget = new Chart(budgetCtx, {
                     type: 'bar',
                     data: {
                         labels: [_t('Budget'), _t('Actual Cost'), _t('Revenue')],
@@ -979,7 +994,7 @@ export class ProjectsTab extends Component {
                     backgroundColors.push(...backgroundColors);
                 }
                 
-                new Chart(costCategoryCtx, {
+                this.charts.costCategory = new Chart(costCategoryCtx, {
                     type: 'doughnut',
                     data: {
                         labels: categories,
@@ -1022,7 +1037,7 @@ export class ProjectsTab extends Component {
             // Cost Breakdown Chart
             const costBreakdownCtx = document.getElementById('project-cost-breakdown-chart');
             if (costBreakdownCtx) {
-                new Chart(costBreakdownCtx, {
+                this.charts.costBreakdown = new Chart(costBreakdownCtx, {
                     type: 'pie',
                     data: {
                         labels: Object.keys(financials.costCategories),
@@ -1052,6 +1067,7 @@ export class ProjectsTab extends Component {
     }
 
     onCloseProjectDetail() {
+        this.destroyCharts();
         this.state.selectedProject = null;
         this.state.selectedProjectReports = [];
     }
@@ -1904,4 +1920,7 @@ export class ProjectsTab extends Component {
             }
         }
     }
-}
\ No newline at end of file
+}
+
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("projects", ProjectsTab);
@@ -3,6 +3,7 @@
 import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
 import { _t } from "@web/core/l10n/translation";
+import { registry } from "@web/core/registry";
 
 export class PurchasesTab extends Component {
     setup() {
@@ -583,4 +584,7 @@ PurchasesTab.props = {
     data: { type: Object, optional: true },
     onFilterChange: { type: Function, optional: true },
     rpcCall: { type: Function, optional: true }
-};
\ No newline at end of file
+};
+
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("purchases", PurchasesTab);
@@ -1,6 +1,7 @@
 /** @odoo-module **/
 
 import { Component } from "@odoo/owl";
+import { registry } from "@web/core/registry";
 
 export class ReportsTab extends Component {
     static template = "farm_management_dashboard.ReportsTabTemplate";
@@ -12,3 +13,5 @@ export class ReportsTab extends Component {
     };
 }
 
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("reports", ReportsTab);
@@ -2,6 +2,7 @@
 
 import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
 import { _t } from "@web/core/l10n/translation";
+import { registry } from "@web/core/registry";
 
 export class SalesTab extends Component {
     static template = "farm_management_dashboard.SalesTabTemplate";
@@ -396,4 +397,7 @@ export class SalesTab extends Component {
         if (growth < 0) return 'fa-arrow-down';
         return 'fa-minus';
     }
-}
\ No newline at end of file
+}
+
+// Loaded lazily with the dashboard tabs bundle, see FarmDashboardMain
+registry.category("farm_dashboard_tabs").add("sales", SalesTab);
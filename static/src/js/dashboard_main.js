@@ -3,34 +3,26 @@
 import { Component, useState, onWillStart, onMounted, onWillUnmount } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
 import { registry } from "@web/core/registry";
+import { loadBundle } from "@web/core/assets";
 import { _t } from "@web/core/l10n/translation";
 
 // Import tab components
 import { DashboardSidebar } from "./components/sidebar/dashboard_sidebar";
 import { OverviewTab } from "./components/tabs/overview_tab";
-import { ProjectsTab } from "./components/tabs/projects_tab";
-import { CropsTab } from "./components/tabs/crops_tab";
-import { FinancialsTab } from "./components/tabs/financials_tab";
-import { SalesTab } from "./components/tabs/sales_tab";
-import { PurchasesTab } from "./components/tabs/purchases_tab";
-import { InventoryTab } from "./components/tabs/inventory_tab";
-import { ReportsTab } from "./components/tabs/reports_tab";
 
 // Import common components
 import { SmartButton } from "./components/common/smart_button";
 
+// Every tab but Overview lives in a separate bundle, fetched the first time
+// one of them is opened. The tabs register themselves in this registry.
+const TABS_BUNDLE = "farm_management_dashboard.assets_dashboard_tabs";
+const tabRegistry = registry.category("farm_dashboard_tabs");
+
 export class FarmDashboardMain extends Component {
     static template = "farm_management_dashboard.MainTemplate";
     static components = {
         DashboardSidebar,
         OverviewTab,
-        ProjectsTab,
-        CropsTab,
-        FinancialsTab,
-        SalesTab,
-        PurchasesTab,
-        InventoryTab,
-        ReportsTab,
         SmartButton,
     };
     
@@ -43,6 +35,13 @@ export class FarmDashboardMain extends Component {
             this.orm = null;
         }
         
+        try {
+            this.quickActions = useService("quickActions");
+        } catch (e) {
+            console.warn("Quick actions service not available, fetching permissions directly");
+            this.quickActions = null;
+        }
+        
         try {
             this.notification = useService("notification");
         } catch (e) {
@@ -123,6 +122,7 @@ export class FarmDashboardMain extends Component {
             
             // Data state
             tabsData: {},
+            tabsBundleLoaded: false,
             userPermissions: null,
             accessibleTabs: [],
             
@@ -172,13 +172,20 @@ export class FarmDashboardMain extends Component {
         this.state.loading.global = true;
         
         try {
-            // Get user permissions and accessible tabs with fallback
+            // Get user permissions and accessible tabs with fallback, both
+            // requests are independent so fetch them concurrently
+            const [permissionsResult, tabsResult] = await Promise.allSettled([
+                this.quickActions
+                    ? this.quickActions.getUserPermissions()
+                    : this.rpcCall('farm.dashboard.access', 'get_user_permissions', []),
+                this.rpcCall('farm.dashboard.access', 'get_accessible_tabs', []),
+            ]);
+            
             try {
-                const permissions = await this.rpcCall(
-                    'farm.dashboard.access',
-                    'get_user_permissions',
-                    []
-                );
+                if (permissionsResult.status === 'rejected') {
+                    throw permissionsResult.reason;
+                }
+                const permissions = permissionsResult.value;
                 console.log('Fetched user permissions:', permissions);
                 // Check if we got demo user - if so, override with real user
                 if (permissions && permissions.role === 'demo_user') {
@@ -198,14 +205,10 @@ export class FarmDashboardMain extends Component {
                 }
             }
             
-            try {
-                this.state.accessibleTabs = await this.rpcCall(
-                    'farm.dashboard.access', 
-                    'get_accessible_tabs',
-                    []
-                );
-            } catch (error) {
-                console.warn('Could not load accessible tabs, using default:', error);
+            if (tabsResult.status === 'fulfilled') {
+                this.state.accessibleTabs = tabsResult.value;
+            } else {
+                console.warn('Could not load accessible tabs, using default:', tabsResult.reason);
                 this.state.accessibleTabs = this.getDefaultTabs();
             }
             
@@ -272,15 +275,20 @@ export class FarmDashboardMain extends Component {
         try {
             console.log(`🔄 Loading data for tab: ${tabKey}`);
             
-            const data = await this.rpcCall(
-                'farm.dashboard.data',
-                'get_dashboard_data',
-                [],
-                {
-                    filters: this.state.filters,
-                    tab: tabKey
-                }
-            );
+            // Fetch the tab component code alongside its data
+            const [data] = await Promise.all([
+                this.rpcCall(
+                    'farm.dashboard.data',
+                    'get_dashboard_data',
+                    [],
+                    {
+                        filters: this.state.filters,
+                        tab: tabKey,
+                        force_refresh: forceRefresh,
+                    }
+                ),
+                this.ensureTabComponent(tabKey),
+            ]);
             
             if (data.error) {
                 throw new Error(data.error);
@@ -306,6 +314,16 @@ export class FarmDashboardMain extends Component {
         }
     }
     
+    async ensureTabComponent(tabKey) {
+        if (tabKey === 'overview' || this.state.tabsBundleLoaded) return;
+        await loadBundle(TABS_BUNDLE);
+        this.state.tabsBundleLoaded = true;
+    }
+    
+    getTabComponent(tabKey) {
+        return tabRegistry.get(tabKey, null);
+    }
+    
     async onFiltersChange(newFilters) {
         console.log('🔍 Filters changed:', newFilters);
         
@@ -3,10 +3,15 @@
 import { registry } from "@web/core/registry";
 
 export class QuickActionsService {
-    constructor() {
+    constructor(orm) {
+        this.orm = orm;
         this.actions = new Map();
         this.contexts = new Map();
         this.permissions = null;
+        
+        // Dashboard user permissions, served stale-while-revalidate
+        this.userPermissions = null;
+        this.userPermissionsRequest = null;
     }
     
     // Register actions for specific contexts
@@ -41,6 +46,38 @@ export class QuickActionsService {
         return this.permissions[permission] === true;
     }
     
+    // Get dashboard user permissions. A cached value is returned right away
+    // while a fresh copy is fetched in the background for the next caller.
+    async getUserPermissions() {
+        const request = this.refreshUserPermissions();
+        if (this.userPermissions) {
+            request.catch((error) => console.warn("Could not refresh user permissions:", error));
+            return this.userPermissions;
+        }
+        return request;
+    }
+    
+    // Fetch user permissions, sharing a single in-flight request between callers
+    refreshUserPermissions() {
+        if (!this.userPermissionsRequest) {
+            this.userPermissionsRequest = this.orm
+                .call("farm.dashboard.access", "get_user_permissions", [])
+                .then((permissions) => {
+                    this.userPermissions = permissions;
+                    return permissions;
+                })
+                .finally(() => {
+                    this.userPermissionsRequest = null;
+                });
+        }
+        return this.userPermissionsRequest;
+    }
+    
+    // Drop cached user permissions so the next call waits for fresh ones
+    invalidateUserPermissions() {
+        this.userPermissions = null;
+    }
+    
     // Create standard Odoo action
     createOdooAction(model, options = {}) {
         const defaultOptions = {
@@ -85,7 +122,13 @@ export class QuickActionsService {
 
 // Register the service
 registry.category("services").add("quickActions", {
-    start() {
-        return new QuickActionsService();
+    dependencies: ["orm", "bus_service"],
+    start(env, { orm, bus_service }) {
+        const service = new QuickActionsService(orm);
+        // Pushed by the server whenever farm.dashboard.access records change
+        bus_service.subscribe("farm_dashboard/permissions_invalidated", () => {
+            service.invalidateUserPermissions();
+        });
+        return service;
     }
 });